@@ -27,158 +27,280 @@ Required API keys:
 - RECIPIENT_NUMBER
 - GOOGLE_CREDENTIALS_PATH (path to Google OAuth credentials JSON file)
 - GOOGLE_TOKEN_PATH (optional, defaults to token.json)
+- LOG_LEVEL (optional, defaults to INFO; replaces the level set by the runner's -v flag)
 
 Run the bot using::
 
     uv run bot.py
 """
+import asyncio
 import os
+import sys
+from typing import TYPE_CHECKING
 
 import aiohttp
 from dotenv import load_dotenv
 from loguru import logger
 
-print("🚀 Starting Pipecat bot...")
-print("⏳ Loading models and imports (20 seconds, first run only)\n")
-
-logger.info("Loading Local Smart Turn Analyzer V3...")
-from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
-
-logger.info("✅ Local Smart Turn Analyzer V3 loaded")
-logger.info("Loading Silero VAD model...")
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-
-logger.info("✅ Silero VAD model loaded")
-
-from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.frames.frames import LLMRunFrame
-
-from pipecat.pipeline.pipeline import Pipeline
-from pipecat.pipeline.runner import PipelineRunner
-from pipecat.pipeline.task import PipelineParams, PipelineTask
-from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
-from pipecat.processors.filters.stt_mute_filter import STTMuteConfig, STTMuteFilter, STTMuteStrategy
-from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIObserver, RTVIProcessor
-from pipecat.runner.types import RunnerArguments
-from pipecat.runner.utils import create_transport
-from pipecat.services.cartesia.tts import CartesiaTTSService
-from pipecat.services.deepgram.stt import DeepgramSTTService
-from pipecat.services.openai.llm import OpenAILLMService
-from pipecat.services.tavus.video import TavusVideoService
-from pipecat.transports.base_transport import BaseTransport, TransportParams
-from pipecat.transports.daily.transport import DailyParams
-
-logger.info("✅ All components loaded successfully!")
+# Pipecat services, transports and the VAD/Smart Turn models take ~20 seconds to import,
+# so they are imported inside bot()/run_bot() and `import bot` stays cheap
+if TYPE_CHECKING:
+    from pipecat.runner.types import RunnerArguments
+    from pipecat.transports.base_transport import BaseTransport
 
 load_dotenv(override=True)
 
-# Import tool functions
-from functions import get_calendar_events, get_gmail_emails, send_whatsapp_reminder
+# Log level for the stderr sink installed by configure_logging()
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+_logging_configured = False
+
+# Service credentials, read once at import
+DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
+CARTESIA_API_KEY = os.getenv("CARTESIA_API_KEY")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+TAVUS_API_KEY = os.getenv("TAVUS_API_KEY")
+TAVUS_REPLICA_ID = os.getenv("TAVUS_REPLICA_ID")
+
+# Tool schemas and system prompt are plain data, so they are built once and shared by
+# every session
+
+# Optional flag shared by the Google tools to bypass the short-lived result cache
+REFRESH_PARAMETER = {
+    "type": "boolean",
+    "description": "Set to true to fetch fresh data instead of reusing results from the last minute, e.g. when the user says something just changed.",
+}
+
+# Define the Calendar function schema for the LLM
+CALENDAR_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "get_calendar_events",
+        "description": "Get calendar events for TODAY. Use this when the user asks about their agenda, schedule, meetings, or what's on their calendar for today.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "refresh": REFRESH_PARAMETER,
+            },
+            "required": [],
+        },
+    },
+}
+
+# Define the Gmail function schema for the LLM
+GMAIL_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "get_gmail_emails",
+        "description": "Get the 2 most recent Gmail emails. Use this when the user asks about their emails, messages, or wants to check their inbox.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "refresh": REFRESH_PARAMETER,
+            },
+            "required": [],
+        },
+    },
+}
+
+# Define the morning briefing (Calendar + Gmail together) function schema for the LLM
+MORNING_BRIEFING_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "get_morning_briefing",
+        "description": "Get today's calendar events AND the 2 most recent Gmail emails in one call. Use this instead of calling the calendar and Gmail functions separately when the user asks about both.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "refresh": REFRESH_PARAMETER,
+            },
+            "required": [],
+        },
+    },
+}
+
+# Define the WhatsApp reminder function schema for the LLM
+WHATSAPP_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "send_whatsapp_reminder",
+        "description": "Send a reminder message via WhatsApp. Use this when the user asks you to send them a text reminder, summary, or message with information they need to remember.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "reminder_text": {
+                    "type": "string",
+                    "description": "The text content of the reminder message to send. This should include all the important information the user wants to be reminded of (e.g., calendar events, tasks, notes).",
+                }
+            },
+            "required": ["reminder_text"],
+        },
+    },
+}
+
+# System prompt for the assistant persona. Tool descriptions already say when each tool
+# applies, so the prompt only covers persona and style. Keep it byte-identical across
+# turns so OpenAI can reuse the cached prompt prefix.
+SYSTEM_PROMPT = (
+    "You are James, a friendly personal assistant who manages the user's calendar and "
+    "Gmail and sends reminders via WhatsApp.\n"
+    "- Use the tools for today's calendar, recent emails, or both at once (prefer "
+    "get_morning_briefing when both are asked for).\n"
+    "- For a reminder, gather what the user wants included, then send it.\n"
+    "- Be concise, natural and conversational.\n"
+    "- Greet the user with: 'Good morning! Are you ready to start the day?'\n"
+    "- Summarize emails casually in your own words from the snippet and subject, e.g. "
+    "'you got one from a colleague about the livestream'. Never list subjects formally."
+)
+
+# Key OpenAI uses to route requests sharing the system + tools prefix to the same cache
+PROMPT_CACHE_KEY = "personal-assistant-v1"
+
+# Seconds of silence before the VAD reports the user stopped speaking
+VAD_STOP_SECS = 0.2
+
+# ONNX Runtime intra-op threads per Smart Turn session. One thread per session avoids
+# oversubscribing the CPU when several sessions run in the same process (Silero VAD
+# already runs single-threaded).
+SMART_TURN_CPU_COUNT = 1
+
+
+def create_audio_analyzers():
+    """Create the VAD and turn analyzers for one session.
+
+    Both analyzers keep per-stream state (VAD recurrent state, turn audio buffer), so
+    they can't be shared between concurrent sessions; each connection gets its own pair.
+
+    Returns:
+        dict: ``vad_analyzer`` and ``turn_analyzer`` keyword arguments for transport params
+    """
+    from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+    from pipecat.audio.vad.silero import SileroVADAnalyzer
+    from pipecat.audio.vad.vad_analyzer import VADParams
+
+    return {
+        "vad_analyzer": SileroVADAnalyzer(params=VADParams(stop_secs=VAD_STOP_SECS)),
+        "turn_analyzer": LocalSmartTurnAnalyzerV3(cpu_count=SMART_TURN_CPU_COUNT),
+    }
 
 
-async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
+# Hosts reached through the shared aiohttp session. Deepgram, Cartesia and OpenAI connect
+# through their own clients when the pipeline starts, so warming them here wouldn't help.
+PRECONNECT_URLS = (
+    "https://www.googleapis.com/",
+    "https://gmail.googleapis.com/",
+    "https://api.twilio.com/",
+)
+
+
+async def preconnect(session: aiohttp.ClientSession):
+    """Open pooled connections (DNS + TLS) so the first tool call skips the handshake.
+
+    Args:
+        session: The shared aiohttp session to warm
+    """
+
+    async def _warm(url):
+        async with session.head(url):
+            pass
+
+    results = await asyncio.gather(*(_warm(url) for url in PRECONNECT_URLS), return_exceptions=True)
+    for url, result in zip(PRECONNECT_URLS, results):
+        if isinstance(result, Exception):
+            logger.debug(f"Preconnect to {url} failed: {result}")
+
+
+async def run_bot(transport: "BaseTransport", runner_args: "RunnerArguments"):
+    from pipecat.frames.frames import LLMRunFrame
+    from pipecat.pipeline.pipeline import Pipeline
+    from pipecat.pipeline.runner import PipelineRunner
+    from pipecat.pipeline.task import PipelineParams, PipelineTask
+    from pipecat.processors.filters.stt_mute_filter import (
+        STTMuteConfig,
+        STTMuteFilter,
+        STTMuteStrategy,
+    )
+    from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIObserver, RTVIProcessor
+    from pipecat.services.cartesia.tts import CartesiaTTSService
+    from pipecat.services.deepgram.stt import DeepgramSTTService
+    from pipecat.services.openai.llm import OpenAILLMService
+    from pipecat.services.tavus.video import TavusVideoService
+
+    # Import tool functions
+    from functions import (
+        get_calendar_events,
+        get_gmail_emails,
+        get_morning_briefing,
+        prewarm_google_credentials,
+        send_whatsapp_reminder,
+    )
+    from llm_context import TrimmedOpenAILLMContext
+
+    logger.info("✅ All components loaded successfully!")
+
     logger.info(f"Starting bot")
-    async with aiohttp.ClientSession() as session:
-        stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
+    # One pooled HTTP session for every aiohttp consumer (Tavus and the tool handlers).
+    # Deepgram, Cartesia and OpenAI stream over their own websocket/httpx clients and
+    # don't accept an aiohttp session.
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=16,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+        force_close=False,
+    )
+    timeout = aiohttp.ClientTimeout(total=30, sock_connect=5)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        stt = DeepgramSTTService(api_key=DEEPGRAM_API_KEY)
 
         tts = CartesiaTTSService(
-            api_key=os.getenv("CARTESIA_API_KEY"),
+            api_key=CARTESIA_API_KEY,
             model_id="sonic-3",  # Use the newest, highest-performing model
             voice_id="f786b574-daa5-4673-aa0c-cbe3e8534c02",  # Recommended Sonic 3 Voice: Katie
+            aggregate_sentences=True,  # Send whole sentences to Cartesia, not per-token chunks
         )
 
-        # Define the Calendar function schema for the LLM
-        calendar_tool_definition = {
-            "type": "function",
-            "function": {
-                "name": "get_calendar_events",
-                "description": "Get calendar events for TODAY. Use this when the user asks about their agenda, schedule, meetings, or what's on their calendar for today.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                },
-            },
-        }
-        
-        # Define the Gmail function schema for the LLM
-        gmail_tool_definition = {
-            "type": "function",
-            "function": {
-                "name": "get_gmail_emails",
-                "description": "Get the 2 most recent Gmail emails. Use this when the user asks about their emails, messages, or wants to check their inbox.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                },
-            },
-        }
-        
-        # Define the WhatsApp reminder function schema for the LLM
-        whatsapp_tool_definition = {
-            "type": "function",
-            "function": {
-                "name": "send_whatsapp_reminder",
-                "description": "Send a reminder message via WhatsApp. Use this when the user asks you to send them a text reminder, summary, or message with information they need to remember.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "reminder_text": {
-                            "type": "string",
-                            "description": "The text content of the reminder message to send. This should include all the important information the user wants to be reminded of (e.g., calendar events, tasks, notes).",
-                        }
-                    },
-                    "required": ["reminder_text"],
-                },
-            },
-        }
-
         # Initialize the LLM
-        llm = OpenAILLMService(api_key=os.getenv("OPENAI_API_KEY"))
+        # run_in_parallel executes tool calls from the same response concurrently, so a
+        # "check my calendar and email" turn overlaps the Google requests
+        llm = OpenAILLMService(
+            api_key=OPENAI_API_KEY,
+            params=OpenAILLMService.InputParams(
+                extra={"extra_body": {"prompt_cache_key": PROMPT_CACHE_KEY}}
+            ),
+            run_in_parallel=True,
+        )
 
         # Register the function handlers
         # Note: First parameter must match tool definition name
         # Second parameter can be any function name
-        llm.register_function("get_calendar_events", get_calendar_events)
-        llm.register_function("get_gmail_emails", get_gmail_emails)
-        llm.register_function("send_whatsapp_reminder", send_whatsapp_reminder)
-
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are a helpful and friendly personal assistant named James. "
-                    "You help manage calendar, emails, and can send reminders via WhatsApp.\n\n"
-                    "Your capabilities:\n"
-                    "1. Check calendar events for TODAY using the 'get_calendar_events' function when asked about agenda, schedule, meetings, or what's on their calendar for today\n"
-                    "2. Check Gmail emails using the 'get_gmail_emails' function when asked about emails, messages, or inbox. This returns the 2 most recent emails.\n"
-                    "3. Send reminders via WhatsApp using the 'send_whatsapp_reminder' function when the user asks you to send them a text reminder or summary\n\n"
-                    "Be conversational and natural. When the user asks about their agenda or calendar, use the calendar function. "
-                    "When they ask about emails or messages, use the Gmail function. "
-                    "When they ask you to send a reminder or text, gather the information they want included and use the WhatsApp function. "
-                    "Keep responses concise and helpful.\n\n"
-                    "When the user first greets you, respond with: 'Good morning! Are you ready to start the day?' This should be your first response after they greet you.\n\n"
-                    "IMPORTANT: When responding about emails, be casual and human-like. Don't list emails formally with subjects. "
-                    "Instead, speak naturally like: 'yeah, you got one from a colleague talking about the livestream' or "
-                    "'someone gave you a lighthearted update about genai trends.' Use the snippet and subject to understand what each email is about, "
-                    "then summarize it casually in your own words. Keep it conversational, not robotic."
-                ),
-            },
-        ]
+        # Handlers call Google and Twilio through the shared aiohttp session
+        llm.register_function(
+            "get_calendar_events", lambda params: get_calendar_events(params, session)
+        )
+        llm.register_function("get_gmail_emails", lambda params: get_gmail_emails(params, session))
+        llm.register_function(
+            "get_morning_briefing", lambda params: get_morning_briefing(params, session)
+        )
+        llm.register_function(
+            "send_whatsapp_reminder", lambda params: send_whatsapp_reminder(params, session)
+        )
+
+        # messages[0] is never edited mid-session so the cached prefix stays valid
+        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
 
         # Initialize the LLM context with tools (per docs, tools go in the context, not the LLM service)
-        context = OpenAILLMContext(
+        # Only the system prompt and recent turns are sent, bounding prompt size per turn
+        context = TrimmedOpenAILLMContext(
             messages,
-            tools=[calendar_tool_definition, gmail_tool_definition, whatsapp_tool_definition]
+            tools=[CALENDAR_TOOL, GMAIL_TOOL, MORNING_BRIEFING_TOOL, WHATSAPP_TOOL]
         )
         
         # Create context aggregator using the LLM service method (per docs)
         context_aggregator = llm.create_context_aggregator(context)
 
         tavus = TavusVideoService(
-            api_key=os.getenv("TAVUS_API_KEY"),
-            replica_id=os.getenv("TAVUS_REPLICA_ID"),
+            api_key=TAVUS_API_KEY,
+            replica_id=TAVUS_REPLICA_ID,
             persona_id="pipecat-stream",  # Uses your bot's TTS voice (Cartesia) instead of Tavus persona voice
             session=session,
         )
@@ -212,16 +334,20 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
             observers=[RTVIObserver(rtvi)],
         )
 
+        # Strong references to fire-and-forget tasks so they aren't garbage collected
+        background_tasks = set()
+
         @transport.event_handler("on_client_connected")
         async def on_client_connected(transport, client):
             logger.info(f"Client connected")
-            # Kick off the conversation so the bot greets the user
-            messages.append(
-                {
-                    "role": "system",
-                    "content": "Start by greeting the user with: 'Good morning! Are you ready to start the day?'"
-                }
-            )
+            # Warm the Google and Twilio connections and the Google token in the background
+            # while the bot greets the user
+            for warmup in (preconnect(session), prewarm_google_credentials()):
+                warmup_task = asyncio.create_task(warmup)
+                background_tasks.add(warmup_task)
+                warmup_task.add_done_callback(background_tasks.discard)
+            # Kick off the conversation so the bot greets the user. The greeting line lives
+            # in SYSTEM_PROMPT, so nothing extra is added to the context for every turn.
             await task.queue_frames([LLMRunFrame()])
 
         @transport.event_handler("on_client_disconnected")
@@ -234,8 +360,27 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
         await runner.run(task)
 
 
-async def bot(runner_args: RunnerArguments):
+def configure_logging():
+    """Log to stderr from a background thread so writes never block the event loop.
+    
+    The Pipecat runner installs its own synchronous sink when it starts, so this runs
+    from bot(), after the runner, and replaces that sink once per process.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    logger.remove()
+    logger.add(sys.stderr, level=LOG_LEVEL, enqueue=True)
+    _logging_configured = True
+
+
+async def bot(runner_args: "RunnerArguments"):
     """Main bot entry point for the bot starter."""
+    configure_logging()
+    logger.info("⏳ Loading models and imports (20 seconds, first run only)")
+    from pipecat.runner.utils import create_transport
+    from pipecat.transports.base_transport import TransportParams
+    from pipecat.transports.daily.transport import DailyParams
 
     transport_params = {
         "daily": lambda: DailyParams(
@@ -245,8 +390,7 @@ async def bot(runner_args: RunnerArguments):
             video_out_is_live=True,
             video_out_width=1280,
             video_out_height=720,
-            vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-            turn_analyzer=LocalSmartTurnAnalyzerV3(),
+            **create_audio_analyzers(),
         ),
         "webrtc": lambda: TransportParams(
             audio_in_enabled=True,
@@ -255,8 +399,7 @@ async def bot(runner_args: RunnerArguments):
             video_out_is_live=True,
             video_out_width=1280,
             video_out_height=720,
-            vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-            turn_analyzer=LocalSmartTurnAnalyzerV3(),
+            **create_audio_analyzers(),
         ),
     }
 
@@ -266,6 +409,8 @@ async def bot(runner_args: RunnerArguments):
 
 
 if __name__ == "__main__":
+    print("🚀 Starting Pipecat bot...")
+
     from pipecat.runner.run import main
 
     main()
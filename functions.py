@@ -1,23 +1,29 @@
 """Bot tool functions for Calendar, Gmail, and WhatsApp.
 
-Provides functions for fetching calendar events, Gmail emails, and sending WhatsApp reminders.
+Provides functions for fetching calendar events, Gmail emails (separately or together as a
+morning briefing), and sending WhatsApp reminders.
+
+Settings are read from the environment at import; bot.py loads .env before importing
+this module.
 """
 
-import json
+import asyncio
 import os
+import re
+import sys
+import threading
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 
-from dotenv import load_dotenv
+import aiohttp
+import orjson
+from cachetools import TTLCache
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 from loguru import logger
 from pipecat.frames.frames import TTSSpeakFrame
 from pipecat.services.llm_service import FunctionCallParams
-from twilio.rest import Client
-
-load_dotenv(override=True)
 
 # Google API scopes
 SCOPES = [
@@ -25,107 +31,423 @@ SCOPES = [
     'https://www.googleapis.com/auth/gmail.readonly'
 ]
 
+# Google OAuth token cache and client secrets files
+GOOGLE_TOKEN_PATH = os.getenv("GOOGLE_TOKEN_PATH", "token.json")
+GOOGLE_CREDENTIALS_PATH = os.getenv("GOOGLE_CREDENTIALS_PATH", "credentials.json")
+
+# Twilio credentials, read once at import
+TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
+TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+
+# WhatsApp sender number with the whatsapp: prefix Twilio expects
+WHATSAPP_FROM_NUMBER = f"whatsapp:{os.getenv('TWILIO_WHATSAPP_NUMBER')}"
+
+# E.164 phone number (e.g. +14155550123) and the separators we strip before checking it
+PHONE_NUMBER_RE = re.compile(r"^\+\d{6,15}$")
+PHONE_SEPARATORS_RE = re.compile(r"[\s()\-]")
+
+# Reminder recipient, normalized once: just the number, then the whatsapp: form for Twilio
+RECIPIENT_NUMBER = PHONE_SEPARATORS_RE.sub("", os.getenv("RECIPIENT_NUMBER", ""))
+WHATSAPP_TO_NUMBER = f"whatsapp:{RECIPIENT_NUMBER}"
+RECIPIENT_NUMBER_VALID = PHONE_NUMBER_RE.match(RECIPIENT_NUMBER) is not None
+
+# Upper bound on a single Twilio send so a hung request can't stall the function call
+TWILIO_SEND_TIMEOUT_SECS = 5.0
+
+# Twilio Messages API endpoint (https://www.twilio.com/docs/messaging/api/message-resource)
+TWILIO_MESSAGES_URL = "https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
+
+# Google REST endpoints used by the Calendar and Gmail tools
+CALENDAR_EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
+GMAIL_MESSAGES_URL = "https://gmail.googleapis.com/gmail/v1/users/me/messages"
+
+# RFC 3339 timestamp in UTC, as the Calendar API expects for timeMin/timeMax
+RFC3339_UTC_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# datetime.fromisoformat() accepts a trailing 'Z' from Python 3.11 on
+_ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Short-lived caches of Calendar/Gmail results so repeat questions within a conversation
+# don't re-hit the Google APIs. The inbox changes more often than the calendar.
+CALENDAR_CACHE_TTL_SECS = 60
+GMAIL_CACHE_TTL_SECS = 30
+_calendar_cache = TTLCache(maxsize=8, ttl=CALENDAR_CACHE_TTL_SECS)
+_gmail_cache = TTLCache(maxsize=8, ttl=GMAIL_CACHE_TTL_SECS)
+
+# Last Calendar result as (timeMin, etag, events). Once the TTL cache expires, the next
+# fetch sends the ETag and reuses these events if Google answers 304 Not Modified.
+_last_calendar = (None, None, None)
+
+# One lock per data source (the first element of the cache key) so concurrent misses
+# (e.g. parallel tool calls) share one fetch without a new lock per dated key
+_cache_locks = defaultdict(asyncio.Lock)
+
+# Sentinel for cache misses, so an entry is looked up (and can expire) only once
+_MISSING = object()
+
+# Google credentials, shared by every tool call. Loading or refreshing them is blocking
+# and runs in worker threads, so access is guarded by a lock.
+_google_lock = threading.Lock()
+_creds = None
+
+# Background task refreshing the access token before it expires
+TOKEN_REFRESH_MARGIN_SECS = 300
+# Floor between background refreshes, in case Google hands back a short-lived token
+TOKEN_REFRESH_MIN_INTERVAL_SECS = 30
+_refresh_task = None
+
+
 def get_google_credentials():
     """Get authenticated Google credentials for Calendar and Gmail APIs.
     
+    The credentials are loaded once and kept in memory; the token file is only
+    re-read or re-written when they have to be refreshed or re-authorized.
+    
     Returns:
         Credentials: Authenticated Google OAuth2 credentials
     """
-    creds = None
-    token_path = os.getenv("GOOGLE_TOKEN_PATH", "token.json")
-    credentials_path = os.getenv("GOOGLE_CREDENTIALS_PATH", "credentials.json")
+    global _creds
+    with _google_lock:
+        creds = _creds
+        if creds and creds.valid:
+            return creds
+        
+        # Load existing token if available
+        if creds is None and os.path.exists(GOOGLE_TOKEN_PATH):
+            creds = Credentials.from_authorized_user_file(GOOGLE_TOKEN_PATH, SCOPES)
+        
+        # If no valid credentials, request authorization
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                if not os.path.exists(GOOGLE_CREDENTIALS_PATH):
+                    raise FileNotFoundError(
+                        f"Google credentials file not found at {GOOGLE_CREDENTIALS_PATH}. "
+                        "Please set GOOGLE_CREDENTIALS_PATH in your .env file or place credentials.json in the project root."
+                    )
+                flow = InstalledAppFlow.from_client_secrets_file(GOOGLE_CREDENTIALS_PATH, SCOPES)
+                creds = flow.run_local_server(port=0)
+            
+            _save_google_credentials(creds)
+        
+        _creds = creds
+        return creds
+
+
+def _save_google_credentials(creds):
+    """Save credentials to the token file for the next run."""
+    with open(GOOGLE_TOKEN_PATH, 'w') as token:
+        token.write(creds.to_json())
+
+
+def _refresh_google_credentials():
+    """Refresh the cached access token ahead of expiry (blocking) and persist it."""
+    with _google_lock:
+        creds = _creds
+        if creds is None:
+            return
+        creds.refresh(Request())
+        _save_google_credentials(creds)
+
+
+async def _token_refresh_loop():
+    """Keep the cached Google access token fresh in the background.
     
-    # Load existing token if available
-    if os.path.exists(token_path):
-        creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+    Refreshes TOKEN_REFRESH_MARGIN_SECS before expiry so tool calls never wait on
+    the refresh round-trip. Stops if the credentials can't be refreshed.
+    """
+    while True:
+        creds = _creds
+        if creds is None or creds.expiry is None or not creds.refresh_token:
+            return
+        
+        # google-auth keeps expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        delay = (creds.expiry - now).total_seconds() - TOKEN_REFRESH_MARGIN_SECS
+        await asyncio.sleep(max(delay, TOKEN_REFRESH_MIN_INTERVAL_SECS))
+        
+        try:
+            await asyncio.to_thread(_refresh_google_credentials)
+            logger.debug("Google access token refreshed")
+        except Exception as e:
+            # Tool calls fall back to refreshing on demand, which restarts this loop
+            logger.warning(f"Background Google token refresh failed: {e}")
+            return
+
+
+async def _load_google_credentials():
+    """Load the Google credentials off the event loop and keep them refreshed.
     
-    # If no valid credentials, request authorization
+    Returns:
+        Credentials: Authenticated Google OAuth2 credentials
+    """
+    global _refresh_task
+    creds = await asyncio.to_thread(get_google_credentials)
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_token_refresh_loop())
+    return creds
+
+
+async def prewarm_google_credentials():
+    """Load (and if needed refresh) the Google credentials ahead of the first tool call.
+    
+    Skipped when there is no saved token, since authorizing opens an interactive
+    browser flow that should only start when the user actually asks for their data.
+    """
+    if _creds or not os.path.exists(GOOGLE_TOKEN_PATH):
+        return
+    try:
+        await _load_google_credentials()
+        logger.info("✅ Google credentials loaded")
+    except Exception as e:
+        logger.warning(f"Could not prewarm Google credentials: {e}")
+
+
+async def _google_headers():
+    """Build the Authorization header from the cached OAuth token."""
+    creds = _creds
     if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            if not os.path.exists(credentials_path):
-                raise FileNotFoundError(
-                    f"Google credentials file not found at {credentials_path}. "
-                    "Please set GOOGLE_CREDENTIALS_PATH in your .env file or place credentials.json in the project root."
-                )
-            flow = InstalledAppFlow.from_client_secrets_file(credentials_path, SCOPES)
-            creds = flow.run_local_server(port=0)
-        
-        # Save credentials for next run
-        with open(token_path, 'w') as token:
-            token.write(creds.to_json())
+        # Token file I/O and refreshes are blocking, so keep them off the event loop
+        creds = await _load_google_credentials()
+    return {'Authorization': f'Bearer {creds.token}'}
+
+
+async def _read_google_json(response):
+    """Parse a Google REST response, raising on API errors."""
+    data = await response.json()
+    if response.status >= 400:
+        raise RuntimeError(
+            f"Google API error {response.status}: {data.get('error', {}).get('message')}"
+        )
+    return data
+
+
+async def _google_get(session, url, params):
+    """GET a Google REST endpoint with the cached OAuth token.
     
-    return creds
+    Args:
+        session: aiohttp session shared with the rest of the pipeline
+        url: Endpoint URL
+        params: Query parameters (a list of pairs for repeated keys)
+        
+    Returns:
+        dict: Parsed JSON response
+    """
+    headers = await _google_headers()
+    async with session.get(url, params=params, headers=headers) as response:
+        return await _read_google_json(response)
+
+
+async def _google_get_if_changed(session, url, params, etag):
+    """Conditionally GET a Google REST endpoint, revalidating a previous response.
+    
+    Args:
+        session: aiohttp session shared with the rest of the pipeline
+        url: Endpoint URL
+        params: Query parameters
+        etag: ETag of the previous response
+        
+    Returns:
+        dict: Parsed JSON response, or None if Google answered 304 Not Modified
+    """
+    headers = await _google_headers()
+    headers['If-None-Match'] = etag
+    async with session.get(url, params=params, headers=headers) as response:
+        if response.status == 304:
+            return None
+        return await _read_google_json(response)
 
 
-async def get_calendar_events(params: FunctionCallParams):
+def _parse_rfc3339(value):
+    """Parse an RFC 3339 timestamp from the Calendar API into an aware datetime."""
+    if _ISO_ACCEPTS_Z:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _format_12h(dt):
+    """Format a time like strftime("%I:%M %p") ("09:30 AM"), independent of the locale."""
+    hour, minute = dt.hour, dt.minute
+    return f"{(hour + 11) % 12 + 1:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+async def _fetch_calendar_events(session):
+    """Fetch today's timed events from the primary Google Calendar.
+    
+    Args:
+        session: aiohttp session shared with the rest of the pipeline
+        
+    Returns:
+        list: Events as dicts with summary, start_time and end_time
+    """
+    # Get the start and end of TODAY in the current local timezone (required for the search filter)
+    now = datetime.now()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    today_end = today_start + timedelta(days=1)
+    
+    # Convert to UTC ISO format for Google Calendar API (required format)
+    time_min = today_start.astimezone(timezone.utc).strftime(RFC3339_UTC_FORMAT)
+    time_max = today_end.astimezone(timezone.utc).strftime(RFC3339_UTC_FORMAT)
+    
+    logger.info(f"📅 Fetching calendar events for today ({now.strftime('%Y-%m-%d')})")
+    
+    # Fetch events from primary calendar, revalidating the previous result for the same day
+    global _last_calendar
+    last_time_min, last_etag, last_events = _last_calendar
+    calendar_params = {
+        'timeMin': time_min,
+        'timeMax': time_max,
+        'maxResults': 50,
+        'singleEvents': 'true',
+        'orderBy': 'startTime'
+    }
+    if last_time_min == time_min and last_etag and last_events is not None:
+        events_result = await _google_get_if_changed(session, CALENDAR_EVENTS_URL, calendar_params, last_etag)
+        if events_result is None:
+            logger.info(f"✅ Calendar unchanged since last fetch: {len(last_events)} timed events")
+            return last_events
+    else:
+        events_result = await _google_get(session, CALENDAR_EVENTS_URL, calendar_params)
+    
+    events = events_result.get('items', [])
+    
+    # Filter events to include only summary and simplified times (focusing on timed events)
+    filtered_events = []
+    for event in events:
+        # We skip events without a 'dateTime' as they are typically all-day events that don't fit the '12:00 PM meeting' structure of the demo.
+        start_time_str = event.get('start', {}).get('dateTime')
+        end_time_str = event.get('end', {}).get('dateTime')
+        summary = event.get('summary', 'Untitled Event')
+
+        if start_time_str and end_time_str:
+            # 1. Parse API string into a local-time Python object
+            start_dt = _parse_rfc3339(start_time_str).astimezone()
+            end_dt = _parse_rfc3339(end_time_str).astimezone()
+            
+            # 2. Format for LLM readability
+            start_time = _format_12h(start_dt)
+            end_time = _format_12h(end_dt)
+
+            filtered_events.append({
+                'summary': summary,
+                'start_time': start_time,
+                'end_time': end_time
+            })
+    
+    # NOTE: events variable in logger will still show max 50 events, but filtered_events is the concise list.
+    logger.info(f"✅ Calendar events retrieved: {len(events)} events (Filtered to {len(filtered_events)} timed events)")
+    _last_calendar = (time_min, events_result.get('etag'), filtered_events)
+    return filtered_events
+
+
+async def _fetch_gmail_emails(session):
+    """Fetch the 2 most recent Gmail emails.
+    
+    Args:
+        session: aiohttp session shared with the rest of the pipeline
+        
+    Returns:
+        list: Emails as dicts with snippet, subject and from
+    """
+    logger.info(f"📧 Fetching 2 most recent Gmail emails")
+    
+    # Get message IDs (list only returns IDs, not full emails)
+    message_list = await _google_get(session, GMAIL_MESSAGES_URL, {'maxResults': 2})
+    message_ids = message_list.get('messages', [])
+    
+    # Fetch every message concurrently, asking only for the two headers we use
+    metadata_params = [('format', 'metadata'), ('metadataHeaders', 'Subject'), ('metadataHeaders', 'From')]
+    messages = await asyncio.gather(*(
+        _google_get(session, f"{GMAIL_MESSAGES_URL}/{msg['id']}", metadata_params)
+        for msg in message_ids
+    ))
+    
+    # Extract snippet, subject, and from for each email (in inbox order)
+    emails_list = []
+    for message in messages:
+        snippet = message.get('snippet', '')
+        # Only Subject and From are requested, so one pass builds the whole lookup
+        headers = {h['name']: h['value'] for h in message.get('payload', {}).get('headers', [])}
+        subject = headers.get('Subject', 'No subject')
+        sender = headers.get('From', 'Unknown sender')
+        
+        emails_list.append({
+            'snippet': snippet,
+            'subject': subject,
+            'from': sender
+        })
+    
+    logger.info(f"✅ Gmail emails retrieved: {len(emails_list)} emails")
+    return emails_list
+
+
+async def _cached_fetch(cache, key, fetch, refresh=False):
+    """Run a Google fetch, reusing a recent result.
+    
+    Args:
+        cache: TTLCache holding results for this kind of fetch
+        key: Cache key for the result
+        fetch: Coroutine function that performs the fetch
+        refresh: Skip the cache and always fetch fresh data
+        
+    Returns:
+        The fetched (or cached) result
+    """
+    if not refresh:
+        result = cache.get(key, _MISSING)
+        if result is not _MISSING:
+            logger.info(f"♻️ Using cached {key[0]} results")
+            return result
+    
+    async with _cache_locks[key[0]]:
+        # Another call may have filled the cache while we waited for the lock
+        if not refresh:
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+        
+        result = await fetch()
+        cache[key] = result
+        return result
+
+
+def _to_tool_json(data):
+    """Encode a tool result as compact JSON (no indentation, non-ASCII kept as-is).
+    
+    The result is only read by the LLM, so whitespace and \\u escapes are wasted tokens.
+    """
+    return orjson.dumps(data).decode()
+
+
+def _calendar_cache_key():
+    """Cache key for today's calendar, so results never carry over past midnight."""
+    return ('calendar', datetime.now().date().isoformat())
+
+
+async def get_calendar_events(params: FunctionCallParams, session: aiohttp.ClientSession):
     """Get calendar events for today.
     
     Args:
-        params: FunctionCallParams (no arguments needed)
+        params: FunctionCallParams with an optional "refresh" flag to bypass the cache
+        session: aiohttp session shared with the rest of the pipeline
         
     Returns:
         str: JSON string of events for today
     """
     try:
-        # Bot speaks immediately before checking schedule
-        await params.llm.push_frame(TTSSpeakFrame("Let me check your schedule"))
-        
-        # Get the start and end of TODAY in the current local timezone (required for the search filter)
-        now = datetime.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
-        
-        # Convert to UTC ISO format for Google Calendar API (required format)
-        time_min = today_start.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
-        time_max = today_end.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
-        
-        logger.info(f"📅 Fetching calendar events for today ({now.strftime('%Y-%m-%d')})")
-        
-        # Get authenticated calendar service
-        creds = get_google_credentials()
-        service = build('calendar', 'v3', credentials=creds)
-        
-        # Fetch events from primary calendar
-        events_result = service.events().list(
-            calendarId='primary',
-            timeMin=time_min,
-            timeMax=time_max,
-            maxResults=50,
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
-        
-        events = events_result.get('items', [])
-        
-        # Filter events to include only summary and simplified times (focusing on timed events)
-        filtered_events = []
-        for event in events:
-            # We skip events without a 'dateTime' as they are typically all-day events that don't fit the '12:00 PM meeting' structure of the demo.
-            start_time_str = event.get('start', {}).get('dateTime')
-            end_time_str = event.get('end', {}).get('dateTime')
-            summary = event.get('summary', 'Untitled Event')
-
-            if start_time_str and end_time_str:
-                # 1. Parse API string (removes 'Z' and converts to Python object)
-                start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00')).astimezone()
-                end_dt = datetime.fromisoformat(end_time_str.replace('Z', '+00:00')).astimezone()
-                
-                # 2. Format for LLM readability
-                start_time = start_dt.strftime("%I:%M %p")
-                end_time = end_dt.strftime("%I:%M %p")
-
-                filtered_events.append({
-                    'summary': summary,
-                    'start_time': start_time,
-                    'end_time': end_time
-                })
-        
-        result = json.dumps(filtered_events, indent=2)
-        
-        # NOTE: events variable in logger will still show max 50 events, but filtered_events is the concise list.
-        logger.info(f"✅ Calendar events retrieved: {len(events)} events (Filtered to {len(filtered_events)} timed events)")
+        # Bot speaks while the schedule is being fetched
+        _, filtered_events = await asyncio.gather(
+            params.llm.push_frame(TTSSpeakFrame("Let me check your schedule")),
+            _cached_fetch(
+                _calendar_cache,
+                _calendar_cache_key(),
+                lambda: _fetch_calendar_events(session),
+                params.arguments.get("refresh", False),
+            ),
+        )
+        
+        result = _to_tool_json(filtered_events)
         await params.result_callback(result)
         return result
         
@@ -136,55 +458,29 @@ async def get_calendar_events(params: FunctionCallParams):
         return error_result
 
 
-async def get_gmail_emails(params: FunctionCallParams):
+async def get_gmail_emails(params: FunctionCallParams, session: aiohttp.ClientSession):
     """Get the 2 most recent Gmail emails.
     
     Args:
-        params: FunctionCallParams (no arguments needed)
+        params: FunctionCallParams with an optional "refresh" flag to bypass the cache
+        session: aiohttp session shared with the rest of the pipeline
         
     Returns:
         str: JSON string of 2 most recent emails
     """
     try:
-        # Bot speaks immediately before checking inbox
-        await params.llm.push_frame(TTSSpeakFrame("Let me check your inbox"))
-        
-        logger.info(f"📧 Fetching 2 most recent Gmail emails")
-        
-        # Get authenticated Gmail service
-        creds = get_google_credentials()
-        service = build('gmail', 'v1', credentials=creds)
-        
-        # Get message IDs (list() only returns IDs, not full emails)
-        message_ids = service.users().messages().list(
-            userId='me',
-            maxResults=2
-        ).execute().get('messages', [])
-        
-        # Extract snippet, subject, and from for each email
-        emails_list = []
-        for msg in message_ids:
-            message = service.users().messages().get(
-                userId='me',
-                id=msg['id'],
-                format='metadata'
-            ).execute()
-            
-            # Extract snippet, subject, and from
-            snippet = message['snippet']
-            headers = message['payload']['headers']
-            subject = next(h['value'] for h in headers if h['name'] == 'Subject')
-            sender = next(h['value'] for h in headers if h['name'] == 'From')
-            
-            emails_list.append({
-                'snippet': snippet,
-                'subject': subject,
-                'from': sender
-            })
-        
-        result = json.dumps(emails_list, indent=2)
+        # Bot speaks while the inbox is being fetched
+        _, emails_list = await asyncio.gather(
+            params.llm.push_frame(TTSSpeakFrame("Let me check your inbox")),
+            _cached_fetch(
+                _gmail_cache,
+                ('gmail',),
+                lambda: _fetch_gmail_emails(session),
+                params.arguments.get("refresh", False),
+            ),
+        )
         
-        logger.info(f"✅ Gmail emails retrieved: {len(emails_list)} emails")
+        result = _to_tool_json(emails_list)
         await params.result_callback(result)
         return result
         
@@ -195,44 +491,88 @@ async def get_gmail_emails(params: FunctionCallParams):
         return error_result
 
 
-async def send_whatsapp_reminder(params: FunctionCallParams):
+async def get_morning_briefing(params: FunctionCallParams, session: aiohttp.ClientSession):
+    """Get today's calendar events and the 2 most recent Gmail emails in one call.
+    
+    Both Google requests run concurrently, so a "calendar and email" turn costs a
+    single round-trip instead of two back-to-back tool calls.
+    
+    Args:
+        params: FunctionCallParams with an optional "refresh" flag to bypass the cache
+        session: aiohttp session shared with the rest of the pipeline
+        
+    Returns:
+        str: JSON string with "calendar" and "emails" lists
+    """
+    try:
+        # Bot speaks while the schedule and inbox are being fetched
+        refresh = params.arguments.get("refresh", False)
+        _, calendar, emails = await asyncio.gather(
+            params.llm.push_frame(TTSSpeakFrame("Let me check your schedule and inbox")),
+            _cached_fetch(
+                _calendar_cache,
+                _calendar_cache_key(),
+                lambda: _fetch_calendar_events(session),
+                refresh,
+            ),
+            _cached_fetch(_gmail_cache, ('gmail',), lambda: _fetch_gmail_emails(session), refresh),
+        )
+        
+        result = _to_tool_json({'calendar': calendar, 'emails': emails})
+        await params.result_callback(result)
+        return result
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to get morning briefing: {e}")
+        error_result = f"Error retrieving morning briefing: {str(e)}"
+        await params.result_callback(error_result)
+        return error_result
+
+
+async def send_whatsapp_reminder(params: FunctionCallParams, session: aiohttp.ClientSession):
     """Send a reminder message via Twilio WhatsApp.
     
+    Posts directly to Twilio's Messages API using the bot's shared aiohttp session,
+    so the send is fully async and reuses the pipeline's connection pool.
+    
     Args:
         params: FunctionCallParams containing the reminder_text in arguments
+        session: aiohttp session shared with the rest of the pipeline
         
     Returns:
         str: Confirmation message
     """
     try:
+        if not TWILIO_ACCOUNT_SID or not TWILIO_AUTH_TOKEN:
+            raise RuntimeError("TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN must be set")
+        
+        # Reject malformed numbers before making a request Twilio would refuse anyway
+        if not RECIPIENT_NUMBER_VALID:
+            raise RuntimeError(f"Invalid recipient phone number: {RECIPIENT_NUMBER!r}")
+        
         # Bot speaks immediately before sending reminder
         await params.llm.push_frame(TTSSpeakFrame("Sending that to your WhatsApp"))
         
         reminder_text = params.arguments.get("reminder_text", "")
         
-        # Get Twilio credentials from environment
-        account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-        auth_token = os.getenv("TWILIO_AUTH_TOKEN")
-        from_number = os.getenv("TWILIO_WHATSAPP_NUMBER")  # Just the number, no whatsapp: prefix
-        from_number = f"whatsapp:{from_number}"  # Add whatsapp: prefix for Twilio
-        
-        recipient_number = os.getenv("RECIPIENT_NUMBER")  # Just the number
-        to_number = f"whatsapp:{recipient_number}"  # Format for Twilio
-        
-        logger.info(f"📤 Preparing WhatsApp reminder:")
-        logger.info(f"   From: {from_number}")
-        logger.info(f"   To: {to_number}")
-        logger.info(f"   Message: {reminder_text}")
+        # Debug details use loguru's {} formatting so nothing is formatted unless DEBUG is on
+        logger.debug(
+            "📤 WhatsApp reminder from={} to={}: {}", WHATSAPP_FROM_NUMBER, WHATSAPP_TO_NUMBER, reminder_text
+        )
         
         # Send message
-        client = Client(account_sid, auth_token)
-        message = client.messages.create(
-            from_=from_number,
-            body=reminder_text,
-            to=to_number
-        )
+        async with session.post(
+            TWILIO_MESSAGES_URL.format(account_sid=TWILIO_ACCOUNT_SID),
+            data={"From": WHATSAPP_FROM_NUMBER, "To": WHATSAPP_TO_NUMBER, "Body": reminder_text},
+            auth=aiohttp.BasicAuth(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN),
+            timeout=aiohttp.ClientTimeout(total=TWILIO_SEND_TIMEOUT_SECS),
+        ) as response:
+            data = await response.json()
+            if response.status >= 400:
+                raise RuntimeError(f"Twilio API error {response.status}: {data.get('message')}")
         
-        logger.info(f"✅ WhatsApp reminder sent successfully. SID: {message.sid}")
+        logger.info(f"✅ WhatsApp reminder sent sid={data['sid']} status={data.get('status')} to={WHATSAPP_TO_NUMBER}")
+        logger.debug("Twilio response: {}", data)
         
         result = f"Reminder sent to WhatsApp successfully!"
         await params.result_callback(result)
@@ -242,4 +582,4 @@ async def send_whatsapp_reminder(params: FunctionCallParams):
         logger.error(f"❌ Failed to send WhatsApp reminder: {e}")
         error_result = f"Error sending WhatsApp reminder: {str(e)}"
         await params.result_callback(error_result)
-        return error_result
\ No newline at end of file
+        return error_result
@@ -0,0 +1,38 @@
+"""LLM context with bounded history.
+
+Keeps the full conversation in memory but only sends the system prompt and the most
+recent messages to OpenAI, so per-turn prompt size stays flat in long sessions.
+"""
+
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+
+# Non-system messages sent with each LLM request (about 10 user/assistant turns)
+MAX_HISTORY_MESSAGES = 20
+
+
+class TrimmedOpenAILLMContext(OpenAILLMContext):
+    """OpenAI LLM context that sends the system prompt plus the latest messages."""
+
+    def __init__(self, *args, max_history_messages: int = MAX_HISTORY_MESSAGES, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._max_history_messages = max_history_messages
+
+    def get_messages(self):
+        """Get the messages to send to the LLM.
+        
+        Returns:
+            list: The leading system prompt followed by at most max_history_messages
+            of the most recent messages
+        """
+        messages = super().get_messages()
+        if len(messages) <= self._max_history_messages + 1:
+            return messages
+
+        head = messages[:1] if messages[0].get("role") == "system" else []
+        tail = messages[-self._max_history_messages:]
+
+        # Tool results can't be sent without the assistant tool_calls message before them
+        while tail and tail[0].get("role") == "tool":
+            tail = tail[1:]
+
+        return head + tail